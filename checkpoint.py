@@ -1,4 +1,5 @@
 from fastapi import FastAPI, Query
+import asyncio
 import httpx
 import os
 
@@ -7,18 +8,58 @@ app = FastAPI()
 API_KEY = os.getenv("CRELATE_API_KEY") or "46gcq4k7bw9yysb9thazasxxwy"
 BASE_URL = "https://app.crelate.com/api3"
 
-async def fetch_crelate_data(path: str, params: dict = {}):
-    url = f"{BASE_URL}/{path}"
-    params["api_key"] = API_KEY
-    async with httpx.AsyncClient() as client:
-        response = await client.get(url, params=params)
-        if response.status_code != 200:
-            return {
-                "requested_url": str(response.url),
-                "status_code": response.status_code,
-                "error": response.text
-            }
-        return response.json()
+# Shared client: pooled keep-alive connections, API key on default headers
+client = httpx.AsyncClient(
+    base_url=BASE_URL,
+    headers={"X-Api-Key": API_KEY},
+    limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+    timeout=30.0,
+)
+
+
+@app.on_event("shutdown")
+async def close_client():
+    await client.aclose()
+
+
+async def fetch_crelate_data(path: str, params: dict = None):
+    response = await client.get(path, params=dict(params or ()))
+    if response.status_code != 200:
+        return {
+            "requested_url": str(response.url),
+            "status_code": response.status_code,
+            "error": response.text
+        }
+    return response.json()
+
+# Keep concurrent page fetches polite toward the Crelate API
+_page_sem = asyncio.Semaphore(8)
+
+
+async def _fetch_page(path, params):
+    async with _page_sem:
+        return await fetch_crelate_data(path, params)
+
+
+async def fetch_all_pages(path: str, page_size=100, max_pages=20, **filters):
+    """Fetch every page of a Crelate listing, pulling pages concurrently."""
+    first = await fetch_crelate_data(path, {**filters, "limit": page_size, "offset": 0})
+    if not isinstance(first, dict) or "Data" not in first:
+        return first
+
+    records = list(first.get("Data") or [])
+    total = (first.get("Metadata") or {}).get("TotalRecords") or 0
+    offsets = range(page_size, min(total, page_size * max_pages), page_size)
+    if offsets:
+        pages = await asyncio.gather(
+            *[_fetch_page(path, {**filters, "limit": page_size, "offset": o}) for o in offsets]
+        )
+        for page in pages:
+            if isinstance(page, dict):
+                records.extend(page.get("Data") or [])
+
+    first["Data"] = records
+    return first
 
 @app.get("/jobs")
 async def get_jobs(
@@ -28,14 +69,18 @@ async def get_jobs(
     created_by: str = None,
     owner: str = None,
     job_type: str = None,
-    primary_owner: str = None
+    primary_owner: str = None,
+    fetch_all: bool = False
 ):
     try:
         params = {"limit": limit, "offset": offset}
         if tag:
             params["tag"] = tag
 
-        raw_data = await fetch_crelate_data("jobs", params)
+        if fetch_all:
+            raw_data = await fetch_all_pages("jobs", page_size=limit, **({"tag": tag} if tag else {}))
+        else:
+            raw_data = await fetch_crelate_data("jobs", params)
 
         if not raw_data or not isinstance(raw_data, dict):
             return {"error": "Unexpected API response format", "response": raw_data}
@@ -44,41 +89,58 @@ async def get_jobs(
         if jobs is None:
             return {"error": "Missing 'Data' key in API response", "response": raw_data}
 
-        def matches_filters(job):
+        # Lowercase each filter value once here instead of per job; the
+        # default args bind them as fast locals inside the hot loop.
+        cb = created_by.lower() if created_by else None
+        jt = job_type.lower() if job_type else None
+        ow = owner.lower() if owner else None
+        po = primary_owner.lower() if primary_owner else None
+
+        def matches_filters(job, _cb=cb, _jt=jt, _ow=ow, _po=po):
             try:
-                if created_by:
+                if _cb is not None:
                     creator = job.get("CreatedById") or {}
-                    if creator.get("Title", "").lower() != created_by.lower():
+                    if creator.get("Title", "").lower() != _cb:
                         return False
 
-                if job_type:
+                if _jt is not None:
                     job_types = job.get("JobTypeIds") or []
-                    if not any(jt and jt.get("Title", "").lower() == job_type.lower() for jt in job_types):
+                    if not any(t and t.get("Title", "").lower() == _jt for t in job_types):
                         return False
 
-                if owner:
+                if _ow is not None:
                     owners = job.get("Owners") or []
-                    if not any(o and o.get("Title", "").lower() == owner.lower() for o in owners):
+                    if not any(o and o.get("Title", "").lower() == _ow for o in owners):
                         return False
 
-                if primary_owner:
-                    owners = job.get("Owners") or []
-                    primary = next((o for o in owners if o and o.get("IsPrimary")), None)
-                    if not primary or primary.get("Title", "").lower() != primary_owner.lower():
+                if _po is not None:
+                    primary = None
+                    for o in job.get("Owners") or []:
+                        if o and o.get("IsPrimary"):
+                            primary = o
+                            break
+                    if not primary or primary.get("Title", "").lower() != _po:
                         return False
 
                 return True
             except Exception as e:
                 raise RuntimeError(f"Error filtering job {job.get('Id', 'unknown')}: {e}")
 
-        filtered_jobs = [job for job in jobs if matches_filters(job)]
+        # Common unfiltered listing skips the predicate entirely
+        if cb is None and jt is None and ow is None and po is None:
+            filtered_jobs = jobs
+        else:
+            filtered_jobs = [job for job in jobs if matches_filters(job)]
 
         display_jobs = []
         for job in filtered_jobs:
             account = job.get("AccountId") or {}
             title = job.get("JobTitleId") or {}
-            owners = job.get("Owners") or []
-            primary = next((o for o in owners if o and o.get("IsPrimary")), None)
+            primary = None
+            for o in job.get("Owners") or []:
+                if o and o.get("IsPrimary"):
+                    primary = o
+                    break
             display_jobs.append({
                 "company": account.get("Title"),
                 "job_title": title.get("Title"),
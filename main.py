@@ -1,68 +1,286 @@
-from fastapi import FastAPI, Query, Body
+# Run with: uvicorn main:app --loop uvloop --http httptools
+# (uvloop halves event-loop overhead vs the default asyncio loop, and the
+# shared HTTP/2 client below lets concurrent page fetches ride one TLS
+# connection instead of opening several.)
+from fastapi import FastAPI, Query, Body, Depends
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from functools import lru_cache
+from itertools import chain
+import asyncio
 import httpx
+import json
+import orjson
 import os
-from fastapi.responses import JSONResponse
+from cachetools import TTLCache
+from fastapi.responses import JSONResponse, ORJSONResponse
 from datetime import datetime
 from fastapi.staticfiles import StaticFiles
+import numpy as np
 import pandas as pd
+from rapidfuzz import fuzz, process
 
-app = FastAPI()
-API_KEY = os.getenv("CRELATE_API_KEY") or "46gcq4k7bw9yysb9thazasxxwy"
-BASE_URL = "https://app.crelate.com/api3"
+try:
+    import polars as pl
+except ImportError:  # optional accelerator; the numpy mask path still works
+    pl = None
 
-# Load local contact fallback database
-EXCEL_CONTACTS_PATH = "API Contacts.xlsx"
 try:
-    local_contacts_df = pd.read_excel(EXCEL_CONTACTS_PATH)
-    local_contacts_df.columns = local_contacts_df.columns.str.strip()
-except Exception:
-    local_contacts_df = pd.DataFrame()
+    import ijson
+except ImportError:  # optional; cache-bypass fetches fall back to buffering
+    ijson = None
 
+API_KEY = os.getenv("CRELATE_API_KEY") or "46gcq4k7bw9yysb9thazasxxwy"
+BASE_URL = "https://app.crelate.com/api3"
 
-def lookup_local_contact(full_name: str):
-    if local_contacts_df.empty:
-        return None
-    match = local_contacts_df[
-        local_contacts_df["Full Name"].str.lower() == full_name.strip().lower()
-    ]
-    if not match.empty:
-        return match.iloc[0]["Id"]
-    return None
+# Shared client so every request reuses pooled keep-alive connections to
+# Crelate instead of paying a fresh TCP+TLS handshake per call. It carries
+# the API key as a default header, so no call site injects credentials.
+client = None
+
+
+def _build_client():
+    return httpx.AsyncClient(
+        base_url=BASE_URL,
+        headers={"X-Api-Key": API_KEY},
+        http2=True,
+        limits=httpx.Limits(
+            max_connections=100, max_keepalive_connections=20, keepalive_expiry=60
+        ),
+        timeout=30.0,
+    )
+
+
+@asynccontextmanager
+async def lifespan(app):
+    global client
+    client = _build_client()
+    app.state.client = client
+    # Parquet read + index building is blocking I/O; run it in a worker
+    # thread so the event loop can serve requests while it warms up.
+    await asyncio.to_thread(_load_local_contacts)
+    yield
+    await client.aclose()
+
+
+app = FastAPI(default_response_class=ORJSONResponse, lifespan=lifespan)
+
+# Local contact fallback database. Loading is deferred off the import path:
+# the lifespan runs it in a worker thread so startup never blocks the event
+# loop, and any direct caller before that triggers the same load lazily.
+EXCEL_CONTACTS_PATH = "API Contacts.xlsx"
+PARQUET_CONTACTS_PATH = "API_Contacts.parquet"
+_FILTER_COLS = ("Full Name", "Created By", "Owner", "Primary Owner", "Tags")
+
+local_contacts_df = pd.DataFrame()
+_local_records = []
+_lc_cols = {}
+_pl_lc = None
+_fullname_index = {}
+_fuzzy_names = []
+_fuzzy_ids = []
+_row_indexes = {}
+_local_loaded = False
+
+
+def _build_row_index(col):
+    idx = {}
+    arr = _lc_cols.get(col)
+    if arr is not None:
+        for i, v in enumerate(arr):
+            idx.setdefault(v.strip(), []).append(i)
+    return idx
+
+
+def _load_local_contacts():
+    """Load the fallback sheet and build every derived lookup structure.
+
+    Excel parsing (openpyxl) is by far the slowest part, so the sheet is
+    snapshotted to Parquet on first run and the snapshot read afterwards.
+    Builds: lowercase filter-column arrays, the Polars mirror frame, the
+    normalized full-name index plus fuzzy lists, and the row indexes.
+    """
+    global local_contacts_df, _local_records, _lc_cols, _pl_lc, _fullname_index
+    global _fuzzy_names, _fuzzy_ids, _row_indexes, _local_loaded
+    if _local_loaded:
+        return
+    try:
+        if not os.path.exists(PARQUET_CONTACTS_PATH):
+            pd.read_excel(EXCEL_CONTACTS_PATH).to_parquet(PARQUET_CONTACTS_PATH)
+        local_contacts_df = pd.read_parquet(PARQUET_CONTACTS_PATH)
+        local_contacts_df.columns = local_contacts_df.columns.str.strip()
+    except Exception:
+        local_contacts_df = pd.DataFrame()
+
+    # Low-cardinality columns are a handful of recruiters/tag strings
+    # repeated thousands of times; category dtype stores each distinct value
+    # once. NaNs are filled first so later fillna("") never meets an
+    # unknown category.
+    for col in ("Created By", "Primary Owner", "Tags"):
+        if col in local_contacts_df.columns:
+            local_contacts_df[col] = local_contacts_df[col].fillna("").astype("category")
+
+    # Lowercase the filterable columns once; per-request filtering then runs
+    # against these cached arrays instead of re-lowercasing whole Series.
+    _lc_cols = {
+        col: local_contacts_df[col].astype(str).str.lower().fillna("").to_numpy()
+        for col in local_contacts_df.columns
+        if col in _FILTER_COLS
+    }
+
+    # Polars mirror of the lowercase columns: string filters run in native
+    # (SIMD) code and return row numbers back into _local_records.
+    if pl is not None and _lc_cols:
+        _pl_lc = pl.DataFrame(
+            {col: list(arr) for col, arr in _lc_cols.items()}
+        ).with_row_index("_row")
+
+    # Point lookups by full name are a dict hit, not a column scan. Keys go
+    # through the same comma/whitespace normalization as normalize_name;
+    # setdefault keeps the first occurrence, matching the old iloc[0]
+    # behaviour on dupes. The name/id lists feed the RapidFuzz fallback.
+    _fullname_index = {}
+    if "Full Name" in _lc_cols:
+        for name, cid in zip(_lc_cols["Full Name"], local_contacts_df["Id"]):
+            _fullname_index.setdefault(" ".join(name.replace(",", "").split()), cid)
+    _fuzzy_names = list(_fullname_index.keys())
+    _fuzzy_ids = list(_fullname_index.values())
+
+    # Row-number indexes for the equality filter columns, so combined
+    # equality filters resolve as set intersections instead of column scans.
+    _row_indexes = {
+        "Full Name": _build_row_index("Full Name"),
+        "Created By": _build_row_index("Created By"),
+        "Primary Owner": _build_row_index("Primary Owner"),
+    }
+
+    # Materialize every row as a plain dict once; request-time filtering
+    # only picks rows out of this list by index, so pandas never runs in
+    # the hot path — it's a load-time dependency only.
+    _local_records = local_contacts_df.fillna("").to_dict(orient="records")
+    _local_loaded = True
+
+
+def lookup_local_contact(full_name: str, fuzzy_cutoff=90):
+    """Exact dict hit first; on a miss, best RapidFuzz match above the cutoff."""
+    if not _local_loaded:
+        _load_local_contacts()
+    needle = normalize_name(full_name)
+    contact_id = _fullname_index.get(needle)
+    if contact_id is not None or not _fuzzy_names:
+        return contact_id
+    match = process.extractOne(
+        needle, _fuzzy_names, scorer=fuzz.ratio, score_cutoff=fuzzy_cutoff
+    )
+    return _fuzzy_ids[match[2]] if match else None
 
 
 def filter_local_contacts(
     full_name=None, tag=None, created_by=None, owner=None, primary_owner=None
 ):
-    if local_contacts_df.empty:
+    if not _local_loaded:
+        _load_local_contacts()
+    if not _local_records:
         return []
-    df = local_contacts_df.copy()
 
-    def safe_filter(col, val, contains=False):
-        if col not in df.columns:
-            return df
-        series = df[col].astype(str).str.lower()
-        val = val.lower()
-        return df[series.str.contains(val, na=False)] if contains else df[series == val]
+    active = [
+        (col, val.lower(), contains)
+        for col, val, contains in (
+            ("Full Name", full_name, False),
+            ("Created By", created_by, False),
+            ("Owner", owner, False),
+            ("Primary Owner", primary_owner, False),
+            ("Tags", tag, True),
+        )
+        if val
+    ]
+
+    # All-equality filter combos on indexed columns resolve via the row
+    # indexes: dict hits plus a set intersection, no column scan at all.
+    if active and all(not contains and col in _row_indexes for col, _, contains in active):
+        rows = None
+        for col, val, _ in active:
+            hits = _row_indexes[col].get(val.strip())
+            if not hits:
+                return []
+            rows = set(hits) if rows is None else rows & set(hits)
+        return [_local_records[i] for i in sorted(rows)]
+
+    if _pl_lc is not None:
+        exprs = [
+            pl.col(col).str.contains(val, literal=True) if contains else pl.col(col) == val
+            for col, val, contains in active
+            if col in _pl_lc.columns
+        ]
+        rows = (_pl_lc.filter(exprs) if exprs else _pl_lc)["_row"].to_list()
+        return [_local_records[i] for i in rows]
+
+    mask = np.ones(len(_local_records), dtype=bool)
+    for col, val, contains in active:
+        arr = _lc_cols.get(col)
+        if arr is None:
+            continue
+        if contains:
+            mask &= np.fromiter((val in s for s in arr), dtype=bool, count=len(arr))
+        else:
+            mask &= arr == val
+        if not mask.any():
+            return []
+
+    return [_local_records[i] for i in np.nonzero(mask)[0]]
+
+
+# Short-TTL cache of parsed Crelate GET responses keyed by (path, params),
+# plus ETag revalidation: after the TTL lapses we send If-None-Match and a
+# 304 lets us reuse the cached body without re-downloading it. TTLCache
+# handles expiry and LRU eviction; the single-flight map below is what
+# keeps concurrent identical fetches from racing the cache.
+_CACHE_TTL = 30.0
+_CACHE_MAX = 256
+_response_cache = TTLCache(maxsize=_CACHE_MAX, ttl=_CACHE_TTL)
+_etags = {}  # key -> (etag, body)
+
+
+# Bound concurrent upstream calls so bursts (pagination fan-out, batch
+# posts) cannot saturate Crelate, and coalesce identical in-flight queries
+# so a thundering herd shares one fetch instead of duplicating it.
+_crelate_sem = asyncio.Semaphore(16)
+_inflight = {}
+
+
+async def fetch_crelate_data(path: str, params: dict = None, cache_bypass=False):
+    # Copy defensively: a shared mutable default (or a caller reusing its
+    # dict) would otherwise leak params across calls and skew cache keys.
+    params = dict(params or ())
+    key = (path, tuple(sorted(params.items())))
+
+    if not cache_bypass:
+        cached = _response_cache.get(key)
+        if cached is not None:
+            return cached
+
+        pending = _inflight.get(key)
+        if pending is not None:
+            return await pending
+
+    task = asyncio.ensure_future(_fetch_and_cache(key, path, params))
+    _inflight[key] = task
+    try:
+        return await task
+    finally:
+        _inflight.pop(key, None)
 
-    if full_name:
-        df = safe_filter("Full Name", full_name)
-    if created_by:
-        df = safe_filter("Created By", created_by)
-    if owner:
-        df = safe_filter("Owner", owner)
-    if primary_owner:
-        df = safe_filter("Primary Owner", primary_owner)
-    if tag:
-        df = safe_filter("Tags", tag, contains=True)
 
-    return df.fillna("").to_dict(orient="records")
+async def _fetch_and_cache(key, path, params):
+    known = _etags.get(key)
+    headers = {"If-None-Match": known[0]} if known else None
+    async with _crelate_sem:
+        response = await client.get(path, params=params, headers=headers)
 
+    if response.status_code == 304 and known:
+        _response_cache[key] = known[1]
+        return known[1]
 
-async def fetch_crelate_data(path: str, params: dict = {}):
-    url = f"{BASE_URL}/{path}"
-    params["api_key"] = API_KEY
-    async with httpx.AsyncClient() as client:
-        response = await client.get(url, params=params)
     if response.status_code != 200:
         return {
             "requested_url": str(response.url),
@@ -70,7 +288,7 @@ async def fetch_crelate_data(path: str, params: dict = {}):
             "error": response.text,
         }
     try:
-        return response.json()
+        data = orjson.loads(response.content)
     except Exception as e:
         return {
             "requested_url": str(response.url),
@@ -79,19 +297,291 @@ async def fetch_crelate_data(path: str, params: dict = {}):
             "raw_text": response.text,
         }
 
+    _response_cache[key] = data
+    etag = response.headers.get("ETag")
+    if etag:
+        _etags[key] = (etag, data)
+    return data
+
+
+# Keep concurrent page fetches polite toward the Crelate API
+_page_sem = asyncio.Semaphore(8)
 
-def safe_get(d, *keys):
-    for key in keys:
-        if d is None:
-            return ""
-        d = d.get(key)
-    return d or ""
 
+async def _fetch_page(path, params):
+    async with _page_sem:
+        return await fetch_crelate_data(path, params)
 
+
+async def fetch_all_pages(path: str, page_size=100, max_pages=20, **filters):
+    """Fetch every page of a Crelate listing, pulling pages concurrently.
+
+    Reads TotalRecords from the first page, then issues the remaining
+    offsets in parallel and concatenates the Data arrays, so N pages cost
+    roughly one round trip instead of N.
+    """
+    first = await fetch_crelate_data(path, {**filters, "limit": page_size, "offset": 0})
+    if not isinstance(first, dict) or "Data" not in first:
+        return first
+
+    records = list(first.get("Data") or [])
+    total = (first.get("Metadata") or {}).get("TotalRecords") or 0
+    offsets = range(page_size, min(total, page_size * max_pages), page_size)
+    if offsets:
+        pages = await asyncio.gather(
+            *[_fetch_page(path, {**filters, "limit": page_size, "offset": o}) for o in offsets]
+        )
+        for page in pages:
+            if isinstance(page, dict):
+                records.extend(page.get("Data") or [])
+
+    # Shallow-copy before swapping in the combined Data so we never mutate
+    # a body that is also sitting in the response cache.
+    first = dict(first)
+    first["Data"] = records
+    return first
+
+
+class _AsyncByteReader:
+    """Adapt an aiter_bytes iterator to the async file API ijson expects.
+
+    Each read() hands over the next chunk; a short read is fine for ijson,
+    and b"" signals end of stream.
+    """
+
+    def __init__(self, aiter):
+        self._aiter = aiter
+
+    async def read(self, size=-1):
+        if size == 0:  # ijson's type probe; must not consume a chunk
+            return b""
+        try:
+            return await self._aiter.__anext__()
+        except StopAsyncIteration:
+            return b""
+
+
+async def _stream_contact_dicts(params):
+    """Yield contacts from a listing response as the body streams in.
+
+    ijson walks the Data array incrementally over aiter_bytes, so peak
+    memory is one contact rather than the whole page tree, and a consumer
+    that stops early also stops the download. Only useful where the parsed
+    body is not going into the response cache, which needs it whole.
+    """
+    async with _crelate_sem:
+        async with client.stream("GET", "contacts", params=params) as response:
+            if response.status_code != 200:
+                return
+            reader = _AsyncByteReader(response.aiter_bytes())
+            async for c in ijson.items(reader, "Data.item"):
+                yield c
+
+
+# Read-only sentinel for inlined nested gets; sharing one dict avoids
+# allocating a throwaway {} on every miss in the shaping loop.
+_EMPTY = {}
+
+
+# Contact names repeat across pages and chained lookups (by-name posting
+# re-queries the same names), so memoize the four-allocation normalization.
+@lru_cache(maxsize=8192)
 def normalize_name(name: str):
     return " ".join(name.lower().replace(",", "").split())
 
 
+@dataclass(slots=True)
+class Contact:
+    """One Crelate contact, parsed from the raw payload dict exactly once.
+
+    The predicates compare against these pre-normalized attributes instead
+    of chasing nested dicts per filter; slots keep the per-record footprint
+    to a fixed tuple of references. ``raw`` is kept for the display fields
+    that only the projection reads.
+    """
+
+    raw: dict
+    name_variants: tuple
+    created_by_cf: str
+    owner_titles_cf: frozenset
+    primary_owner_title: str
+    primary_owner_cf: str
+    tag_titles: list
+    tag_titles_cf: frozenset
+
+
+def _parse_contact(c):
+    """Build a Contact from a raw payload dict, normalizing as we go."""
+    primary = ""
+    owner_titles_cf = []
+    for o in c.get("Owners") or ():
+        if not isinstance(o, dict):
+            continue
+        t = o.get("Title") or ""
+        owner_titles_cf.append(_title_norm(t))
+        if not primary and o.get("IsPrimary"):
+            primary = t
+
+    tag_titles = [
+        t["Title"]
+        for t in chain.from_iterable(
+            v for v in (c.get("Tags") or _EMPTY).values() if isinstance(v, list)
+        )
+        if isinstance(t, dict) and t.get("Title")
+    ]
+
+    # Both orderings of the normalized name, deduplicated: single-token
+    # names collapse to one variant, so the name filter scans once.
+    name_norm = normalize_name(c.get("Name", "") or "")
+    name_rev = " ".join(reversed(name_norm.split()))
+    return Contact(
+        raw=c,
+        name_variants=(name_norm,) if name_rev == name_norm else (name_norm, name_rev),
+        created_by_cf=_title_norm((c.get("CreatedById") or _EMPTY).get("Title")),
+        owner_titles_cf=frozenset(owner_titles_cf),
+        primary_owner_title=primary,
+        primary_owner_cf=_title_norm(primary),
+        tag_titles=tag_titles,
+        tag_titles_cf=frozenset(_title_norm(t) for t in tag_titles),
+    )
+
+
+@dataclass(slots=True)
+class NormalizedFilters:
+    """Contact filters with values casefolded once at request entry.
+
+    The *_cf fields are what the per-row predicates compare against, so no
+    handler or loop ever lowercases a query param again. casefold() is also
+    the correct Unicode-insensitive comparator where lower() is not.
+    """
+
+    full_name: str = None
+    tag: str = None
+    created_by: str = None
+    owner: str = None
+    primary_owner: str = None
+    full_name_cf: str = None
+    tag_cf: str = None
+    created_by_cf: str = None
+    owner_cf: str = None
+    primary_owner_cf: str = None
+
+    @classmethod
+    def from_query(
+        cls,
+        full_name: str = None,
+        tag: str = None,
+        created_by: str = None,
+        owner: str = None,
+        primary_owner: str = None,
+    ):
+        return cls(
+            full_name,
+            tag,
+            created_by,
+            owner,
+            primary_owner,
+            full_name_cf=full_name.strip().casefold() if full_name else None,
+            tag_cf=tag.strip().casefold() if tag else None,
+            created_by_cf=created_by.strip().casefold() if created_by else None,
+            owner_cf=owner.strip().casefold() if owner else None,
+            primary_owner_cf=primary_owner.strip().casefold() if primary_owner else None,
+        )
+
+
+@dataclass(slots=True)
+class DisplayContact:
+    """Shaped contact record returned by /contacts.
+
+    A slots dataclass is cheaper to construct and hold than a 13-key dict
+    literal and still serializes to the same JSON object through FastAPI's
+    encoder.
+    """
+
+    Id: str = ""
+    FullName: str = ""
+    CreatedBy: str = ""
+    PrimaryOwner: str = ""
+    Tags: list = None
+    Location: str = ""
+    Email_Work: str = ""
+    Email_Personal: str = ""
+    Phone_Work: str = ""
+    Phone_Mobile: str = ""
+    LastActivityDate: str = ""
+    LastActivityRegarding: str = ""
+    Description: str = ""
+
+
+@lru_cache(maxsize=4096)
+def _title_norm(title):
+    """Normalized form of a Title string, memoized.
+
+    Creator and owner titles are a small set of recruiters repeated across
+    every contact, so after warm-up this is a dict hit instead of two
+    string allocations per comparison.
+    """
+    return (title or "").strip().casefold()
+
+
+def build_predicates(target=None, created_by=None, owner=None, primary_owner=None, tag=None):
+    """Compile the active filters into per-Contact closures.
+
+    Filter values arrive already casefolded and the contacts already
+    parsed, so every closure is attribute access plus one comparison;
+    inactive filters contribute no closure at all.
+    """
+    preds = []
+
+    if target:
+        def name_pred(ct, _t=target):
+            return any(_t in v for v in ct.name_variants)
+        preds.append(name_pred)
+
+    if created_by:
+        def created_pred(ct, _v=created_by):
+            return ct.created_by_cf == _v
+        preds.append(created_pred)
+
+    if owner:
+        def owner_pred(ct, _v=owner):
+            return _v in ct.owner_titles_cf
+        preds.append(owner_pred)
+
+    if primary_owner:
+        def primary_pred(ct, _v=primary_owner):
+            return ct.primary_owner_cf == _v
+        preds.append(primary_pred)
+
+    if tag:
+        def tag_pred(ct, _v=tag):
+            return _v in ct.tag_titles_cf
+        preds.append(tag_pred)
+
+    return preds
+
+
+def _shape_contact(ct):
+    c = ct.raw
+    return DisplayContact(
+        c.get("Id", ""),
+        c.get("Name", ""),
+        (c.get("CreatedById") or _EMPTY).get("Title") or "",
+        ct.primary_owner_title,
+        ct.tag_titles,
+        (c.get("Addresses_Home") or _EMPTY).get("Value")
+        or (c.get("Addresses_Business") or _EMPTY).get("Value")
+        or "",
+        (c.get("EmailAddresses_Work") or _EMPTY).get("Value") or "",
+        (c.get("EmailAddresses_Personal") or _EMPTY).get("Value") or "",
+        (c.get("PhoneNumbers_Work_Main") or _EMPTY).get("Value") or "",
+        (c.get("PhoneNumbers_Mobile") or _EMPTY).get("Value") or "",
+        c.get("LastActivityDate", ""),
+        (c.get("LastActivityRegardingId") or _EMPTY).get("Title") or "",
+        c.get("Description", ""),
+    )
+
+
 async def fetch_filtered_contacts(
     limit=100,
     offset=0,
@@ -101,7 +591,20 @@ async def fetch_filtered_contacts(
     owner=None,
     primary_owner=None,
     debug=False,
+    fetch_all=False,
+    nf: NormalizedFilters = None,
+    cache_bypass=False,
 ):
+    # Callers outside the HTTP layer pass raw values; normalize them here
+    # the same way the dependency would.
+    if nf is None:
+        nf = NormalizedFilters.from_query(
+            full_name, tag, created_by, owner, primary_owner
+        )
+    full_name, tag, created_by, owner, primary_owner = (
+        nf.full_name, nf.tag, nf.created_by, nf.owner, nf.primary_owner
+    )
+
     params = {"limit": limit, "offset": offset}
 
     # -- split full_name into first_name & last_name for server‐side filter
@@ -123,7 +626,36 @@ async def fetch_filtered_contacts(
     if primary_owner:
         params["primary_owner"] = primary_owner
 
-    raw_data = await fetch_crelate_data("contacts", params)
+    target = normalize_name(full_name) if full_name else None
+    preds = build_predicates(
+        target=target,
+        created_by=nf.created_by_cf,
+        owner=nf.owner_cf,
+        primary_owner=nf.primary_owner_cf,
+        tag=nf.tag_cf,
+    )
+    max_records = None if fetch_all else limit
+
+    # Bypass fetches skip the response cache, so nothing needs the whole
+    # body: stream-parse the Data array and filter contacts as they
+    # decode, stopping the download once limit records are kept.
+    if cache_bypass and not fetch_all and ijson is not None:
+        results = []
+        async for c in _stream_contact_dicts(params):
+            if not isinstance(c, dict):
+                continue
+            ct = _parse_contact(c)
+            if not preds or all(p(ct) for p in preds):
+                results.append(_shape_contact(ct))
+                if max_records is not None and len(results) >= max_records:
+                    break
+        return results
+
+    if fetch_all:
+        filters = {k: v for k, v in params.items() if k not in ("limit", "offset")}
+        raw_data = await fetch_all_pages("contacts", page_size=limit, **filters)
+    else:
+        raw_data = await fetch_crelate_data("contacts", params, cache_bypass=cache_bypass)
     if debug:
         print(f"[fetch_filtered_contacts] params={params} raw_data={raw_data}")
 
@@ -131,91 +663,27 @@ async def fetch_filtered_contacts(
         return []
 
     contacts = raw_data.get("Data", []) or []
-    target = normalize_name(full_name) if full_name else None
-
-    def matches_filters(contact):
-        if not isinstance(contact, dict):
-            return False
-
-        if target:
-            contact_name = normalize_name(contact.get("Name", "") or "")
-            reversed_contact = " ".join(reversed(contact_name.split()))
-            if target not in contact_name and target not in reversed_contact:
-                return False
-
-        if created_by:
-            creator = contact.get("CreatedById") or {}
-            if (creator.get("Title") or "").strip().lower() != created_by.strip().lower():
-                return False
-
-        if owner:
-            owners = contact.get("Owners") or []
-            if not any(
-                (o.get("Title") or "").strip().lower() == owner.strip().lower()
-                for o in owners
-                if isinstance(o, dict)
-            ):
-                return False
-
-        if primary_owner:
-            owners = contact.get("Owners") or []
-            primary = next(
-                (o for o in owners if o.get("IsPrimary") and isinstance(o, dict)), None
-            )
-            if not primary or (
-                primary.get("Title") or ""
-            ).strip().lower() != primary_owner.strip().lower():
-                return False
-
-        if tag:
-            tags_dict = contact.get("Tags") or {}
-            match = False
-            for tag_list in tags_dict.values():
-                if isinstance(tag_list, list) and any(
-                    (t.get("Title") or "").strip().lower() == tag.strip().lower()
-                    for t in tag_list
-                    if isinstance(t, dict)
-                ):
-                    match = True
-                    break
-            if not match:
-                return False
-
-        return True
 
+    # Parse once, then filter and projection run fused in one pass; in
+    # single-page mode we stop as soon as limit records are kept
+    # (fetch_all wants all).
     results = []
-    for c in contacts:
-        if matches_filters(c):
-            results.append(
-                {
-                    "Id": c.get("Id", ""),
-                    "FullName": c.get("Name", ""),
-                    "CreatedBy": safe_get(c.get("CreatedById"), "Title"),
-                    "PrimaryOwner": next(
-                        (o.get("Title") for o in c.get("Owners", []) if o.get("IsPrimary")),
-                        "",
-                    ),
-                    "Tags": [
-                        t.get("Title")
-                        for v in (c.get("Tags") or {}).values()
-                        for t in (v if isinstance(v, list) else [])
-                        if isinstance(t, dict) and t.get("Title")
-                    ],
-                    "Location": safe_get(c.get("Addresses_Home"), "Value")
-                    or safe_get(c.get("Addresses_Business"), "Value"),
-                    "Email_Work": safe_get(c.get("EmailAddresses_Work"), "Value"),
-                    "Email_Personal": safe_get(
-                        c.get("EmailAddresses_Personal"), "Value"
-                    ),
-                    "Phone_Work": safe_get(c.get("PhoneNumbers_Work_Main"), "Value"),
-                    "Phone_Mobile": safe_get(c.get("PhoneNumbers_Mobile"), "Value"),
-                    "LastActivityDate": c.get("LastActivityDate", ""),
-                    "LastActivityRegarding": safe_get(
-                        c.get("LastActivityRegardingId"), "Title"
-                    ),
-                    "Description": c.get("Description", ""),
-                }
-            )
+    if preds:
+        for c in contacts:
+            if not isinstance(c, dict):
+                continue
+            ct = _parse_contact(c)
+            if all(p(ct) for p in preds):
+                results.append(_shape_contact(ct))
+                if max_records is not None and len(results) >= max_records:
+                    break
+    else:
+        # Zero active filters: parse and shape straight through
+        for c in contacts:
+            if isinstance(c, dict):
+                results.append(_shape_contact(_parse_contact(c)))
+                if max_records is not None and len(results) >= max_records:
+                    break
 
     return results
 
@@ -224,29 +692,77 @@ async def fetch_filtered_contacts(
 async def get_contacts(
     limit: int = Query(100, ge=1, le=100),
     offset: int = 0,
-    full_name: str = None,
-    tag: str = None,
-    created_by: str = None,
-    owner: str = None,
-    primary_owner: str = None,
+    nf: NormalizedFilters = Depends(NormalizedFilters.from_query),
     debug: bool = False,
+    fetch_all: bool = False,
+    cache_bypass: bool = False,
 ):
     try:
-        filtered = await fetch_filtered_contacts(
-            limit, offset, full_name, tag, created_by, owner, primary_owner, debug
+        remote_task = asyncio.create_task(
+            fetch_filtered_contacts(
+                limit, offset, debug=debug, fetch_all=fetch_all, nf=nf,
+                cache_bypass=cache_bypass,
+            )
         )
-        if filtered:
-            return {"records": filtered}
 
-        fallback = filter_local_contacts(
-            full_name, tag, created_by, owner, primary_owner
+        # With filters active, compute the local fallback concurrently in a
+        # worker thread: if the remote comes back empty the answer is
+        # already there, at the cost of a little wasted CPU when it isn't.
+        # The unfiltered listing materializes the whole sheet, so that case
+        # stays lazy and only runs on an actual remote miss.
+        any_filter = any(
+            (nf.full_name, nf.tag, nf.created_by, nf.owner, nf.primary_owner)
         )
+        if any_filter:
+            fallback = await asyncio.to_thread(
+                filter_local_contacts,
+                nf.full_name, nf.tag, nf.created_by, nf.owner, nf.primary_owner,
+            )
+        filtered = await remote_task
+        if filtered:
+            return {"records": filtered}
+        if not any_filter:
+            fallback = await asyncio.to_thread(
+                filter_local_contacts,
+                nf.full_name, nf.tag, nf.created_by, nf.owner, nf.primary_owner,
+            )
         return {"records": fallback}
 
     except Exception as e:
         return {"error": "Exception caught in get_contacts", "detail": str(e)}
 
 
+# Static portion of the screen-activity payload and its headers, built
+# once; per request we only merge in the contact id, notes and timestamp.
+_ACTIVITY_ENTITY_TPL = {
+    "VerbId": {
+        "Id": "2d4edbf9-a7a2-4174-ae53-a8f900bb0381",
+        "Title": "Screen",
+    },
+    "Subject": "Screen via API",
+    "IsEngagement": True,
+    "Completed": True,
+}
+_ACTIVITY_HEADERS = {"Content-Type": "application/json"}
+
+
+@app.get("/health")
+async def health():
+    """Ping Crelate and report the negotiated HTTP version.
+
+    http_version should read HTTP/2 when the upstream negotiates h2; if it
+    shows HTTP/1.1 the multiplexing benefit of the shared client is gone.
+    """
+    try:
+        response = await client.get("contacts", params={"limit": 1})
+        return {
+            "upstream_status": response.status_code,
+            "http_version": response.http_version,
+        }
+    except Exception as e:
+        return {"error": "Upstream health check failed", "detail": str(e)}
+
+
 @app.post("/post_screen_activity")
 async def post_screen_activity(payload: dict = Body(...)):
     try:
@@ -257,28 +773,19 @@ async def post_screen_activity(payload: dict = Body(...)):
                 status_code=400, content={"error": "Missing required EntityId or Notes"}
             )
 
-        current_time = datetime.utcnow().isoformat() + "Z"
-        activity_payload = {
-            "entity": {
-                "ParentId": {"Id": contact_id, "EntityName": "Contacts"},
-                "VerbId": {
-                    "Id": "2d4edbf9-a7a2-4174-ae53-a8f900bb0381",
-                    "Title": "Screen",
-                },
-                "Subject": "Screen via API",
-                "Html": notes,
-                "IsEngagement": True,
-                "Completed": True,
-                "When": current_time,
+        body = orjson.dumps(
+            {
+                "entity": {
+                    **_ACTIVITY_ENTITY_TPL,
+                    "ParentId": {"Id": contact_id, "EntityName": "Contacts"},
+                    "Html": notes,
+                    "When": datetime.utcnow().isoformat() + "Z",
+                }
             }
-        }
-
-        url = f"{BASE_URL}/activities"
-        headers = {"X-Api-Key": API_KEY, "Content-Type": "application/json"}
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                url, json=activity_payload, headers=headers
-            )
+        )
+        response = await client.post(
+            "activities", content=body, headers=_ACTIVITY_HEADERS
+        )
         if response.status_code != 200:
             return {
                 "error": "Failed to post activity",
@@ -286,12 +793,30 @@ async def post_screen_activity(payload: dict = Body(...)):
                 "response": response.text,
             }
 
-        return {"success": True, "response": response.json()}
+        return {"success": True, "response": orjson.loads(response.content)}
 
     except Exception as e:
         return {"error": "Exception occurred while posting activity", "detail": str(e)}
 
 
+async def _resolve_contact_id(full_name):
+    """Resolve a full name to a contact id.
+
+    Runs the Crelate lookup and the local Excel fallback concurrently so a
+    remote miss costs no extra wait for the fallback answer. The name
+    filter is pushed server-side, so one record is enough to transfer.
+    """
+    remote_task = asyncio.create_task(
+        fetch_filtered_contacts(limit=1, full_name=full_name)
+    )
+    local_task = asyncio.to_thread(lookup_local_contact, full_name)
+    contact_list, local_id = await asyncio.gather(remote_task, local_task)
+    if not contact_list:
+        # in case Crelate ignored the name params, rescan a full page
+        contact_list = await fetch_filtered_contacts(full_name=full_name)
+    return contact_list[0].Id if contact_list else local_id
+
+
 @app.post("/post_screen_activity_by_name")
 async def post_screen_activity_by_name(payload: dict = Body(...)):
     try:
@@ -302,9 +827,7 @@ async def post_screen_activity_by_name(payload: dict = Body(...)):
                 status_code=400, content={"error": "Missing required FullName or Notes"}
             )
 
-        contact_list = await fetch_filtered_contacts(full_name=full_name)
-        contact_id = contact_list[0].get("Id") if contact_list else lookup_local_contact(full_name)
-
+        contact_id = await _resolve_contact_id(full_name)
         if not contact_id:
             return JSONResponse(
                 status_code=404,
@@ -316,6 +839,53 @@ async def post_screen_activity_by_name(payload: dict = Body(...)):
     except Exception as e:
         return {"error": "Exception occurred while posting by name", "detail": str(e)}
 
+
+# Bound fan-out so a large batch can't flood Crelate with concurrent posts
+_bulk_post_sem = asyncio.Semaphore(20)
+
+
+@app.post("/post_screen_activity_by_names")
+async def post_screen_activity_by_names(payloads: list = Body(...)):
+    """Post a screen activity for each payload in one batch.
+
+    The lookup half runs first for the whole batch: entries carrying an
+    EntityId skip resolution entirely, and the remaining names are
+    deduplicated and resolved concurrently (repeat names cost one lookup,
+    not one per entry). The activity POSTs then fan out together under the
+    bulk semaphore.
+    """
+    try:
+        names = {
+            p["FullName"]
+            for p in payloads
+            if isinstance(p, dict) and p.get("FullName") and not p.get("EntityId")
+        }
+        ids = await asyncio.gather(*(_resolve_contact_id(n) for n in names))
+        resolved = dict(zip(names, ids))
+
+        async def post_one(p):
+            if not isinstance(p, dict):
+                return {"error": "Invalid batch entry", "entry": p}
+            contact_id = p.get("EntityId") or resolved.get(p.get("FullName"))
+            if not contact_id:
+                return {
+                    "error": f"No contact found with full name '{p.get('FullName')}'"
+                }
+            async with _bulk_post_sem:
+                return await post_screen_activity(
+                    {"EntityId": contact_id, "Notes": p.get("Notes")}
+                )
+
+        results = await asyncio.gather(*(post_one(p) for p in payloads))
+        out = []
+        for r in results:
+            out.append(json.loads(r.body) if isinstance(r, JSONResponse) else r)
+        return {"results": out}
+
+    except Exception as e:
+        return {"error": "Exception occurred while posting batch", "detail": str(e)}
+
+
 @app.get("/test-contacts-filter")
 async def test_contacts_filter(
     tag: str = Query(None, alias="tag_names"),
@@ -348,11 +918,7 @@ async def test_contacts_filter(
         if primary_owner:
             params["primary_owner"] = primary_owner
 
-        url = f"{BASE_URL}/contacts"
-        headers = {"X-Api-Key": API_KEY}
-
-        async with httpx.AsyncClient() as client:
-            response = await client.get(url, params=params, headers=headers)
+        response = await client.get("contacts", params=params)
 
         # Debug raw response (optional)
         if debug:
@@ -365,7 +931,7 @@ async def test_contacts_filter(
         contacts = []
         if response.status_code == 200:
             try:
-                data = response.json()
+                data = orjson.loads(response.content)
                 if isinstance(data, dict):
                     contacts = data.get("Data") or []
                     if not isinstance(contacts, list):
@@ -384,7 +950,7 @@ async def test_contacts_filter(
                 {
                     "Id": c.get("Id", ""),
                     "FullName": c.get("FullName", ""),  # First Last format
-                    "CreatedBy": safe_get(c.get("CreatedById"), "Title"),
+                    "CreatedBy": (c.get("CreatedById") or _EMPTY).get("Title") or "",
                     "PrimaryOwner": next(
                         (o.get("Title") for o in c.get("Owners", []) if o.get("IsPrimary")),
                         "",
@@ -395,16 +961,16 @@ async def test_contacts_filter(
                         for t in (v if isinstance(v, list) else [])
                         if isinstance(t, dict) and t.get("Title")
                     ],
-                    "Location": safe_get(c.get("Addresses_Home"), "Value")
-                    or safe_get(c.get("Addresses_Business"), "Value"),
-                    "Email_Work": safe_get(c.get("EmailAddresses_Work"), "Value"),
-                    "Email_Personal": safe_get(c.get("EmailAddresses_Personal"), "Value"),
-                    "Phone_Work": safe_get(c.get("PhoneNumbers_Work_Main"), "Value"),
-                    "Phone_Mobile": safe_get(c.get("PhoneNumbers_Mobile"), "Value"),
+                    "Location": (c.get("Addresses_Home") or _EMPTY).get("Value")
+                    or (c.get("Addresses_Business") or _EMPTY).get("Value")
+                    or "",
+                    "Email_Work": (c.get("EmailAddresses_Work") or _EMPTY).get("Value") or "",
+                    "Email_Personal": (c.get("EmailAddresses_Personal") or _EMPTY).get("Value") or "",
+                    "Phone_Work": (c.get("PhoneNumbers_Work_Main") or _EMPTY).get("Value") or "",
+                    "Phone_Mobile": (c.get("PhoneNumbers_Mobile") or _EMPTY).get("Value") or "",
                     "LastActivityDate": c.get("LastActivityDate", ""),
-                    "LastActivityRegarding": safe_get(
-                        c.get("LastActivityRegardingId"), "Title"
-                    ),
+                    "LastActivityRegarding": (c.get("LastActivityRegardingId") or _EMPTY).get("Title")
+                    or "",
                     "Description": c.get("Description", ""),
                 }
             )
@@ -439,20 +1005,18 @@ async def test_jobs_filter(
     limit: int = 100,
 ):
     try:
-        params = {"limit": limit, "api_key": API_KEY}
+        params = {"limit": limit}
         if tag_names:
             params["tag_names"] = tag_names
         if name:
             params["name"] = name
 
-        url = f"{BASE_URL}/jobs"
-        async with httpx.AsyncClient() as client:
-            response = await client.get(url, params=params)
+        response = await client.get("jobs", params=params)
 
         return {
             "status": response.status_code,
             "url": str(response.url),
-            "response": response.json() if response.status_code == 200 else response.text,
+            "response": orjson.loads(response.content) if response.status_code == 200 else response.text,
         }
     except Exception as e:
         return {"error": "Exception in /test-jobs-filter", "detail": str(e)}
@@ -461,16 +1025,14 @@ async def test_jobs_filter(
 @app.get("/contacts/id/{contact_id}/artifacts")
 async def get_contact_artifacts_by_id(contact_id: str):
     try:
-        headers = {"X-Api-Key": API_KEY}
-        async with httpx.AsyncClient() as client:
-            response = await client.get(f"{BASE_URL}/entities/{contact_id}/artifacts", headers=headers)
-            if response.status_code != 200:
-                return {
-                    "error": "Failed to retrieve artifacts",
-                    "status_code": response.status_code,
-                    "response": response.text
-                }
-            data = response.json()
+        response = await client.get(f"entities/{contact_id}/artifacts")
+        if response.status_code != 200:
+            return {
+                "error": "Failed to retrieve artifacts",
+                "status_code": response.status_code,
+                "response": response.text
+            }
+        data = orjson.loads(response.content)
 
         return {"artifacts": data.get("Data", []), "total": data.get("Metadata", {}).get("TotalRecords")}
 